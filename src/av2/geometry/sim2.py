@@ -14,7 +14,7 @@ import math
 import numbers
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import Tuple, Union
 
 import numpy as np
 from upath import UPath
@@ -24,6 +24,25 @@ from av2.utils.helpers import assert_np_array_shape
 from av2.utils.typing import NDArrayFloat
 
 
+def _isclose(a: float, b: float, rtol: float = 1e-5, atol: float = 1e-8) -> bool:
+    """Compare two scalars like `np.isclose` (same default tolerances), w/o NumPy dispatch or temporary arrays.
+
+    As in `np.isclose`, infinite values are only close to an identical infinity, and NaN is never close to anything.
+
+    Args:
+        a: first value to compare.
+        b: reference value to compare against.
+        rtol: relative tolerance, w.r.t. `b`.
+        atol: absolute tolerance.
+
+    Returns:
+        Whether |a - b| <= atol + rtol * |b|, for finite values; otherwise whether a == b.
+    """
+    if not (math.isfinite(a) and math.isfinite(b)):
+        return bool(a == b)
+    return bool(abs(a - b) <= atol + rtol * abs(b))
+
+
 @dataclass(frozen=True)
 class Sim2:
     """Similarity(2) lie group object.
@@ -67,9 +86,9 @@ class Sim2:
         Returns:
             Rotation angle from the 2d rotation matrix.
         """
-        c, s = self.R[0, 0], self.R[1, 0]
-        theta_rad = np.arctan2(s, c)
-        return float(np.rad2deg(theta_rad))
+        c, s = float(self.R[0, 0]), float(self.R[1, 0])
+        theta_rad = math.atan2(s, c)
+        return math.degrees(theta_rad)
 
     def __repr__(self) -> str:
         """Return a human-readable string representation of the class."""
@@ -77,17 +96,21 @@ class Sim2:
         return f"Angle (deg.): {self.theta_deg:.1f}, Trans.: {trans}, Scale: {self.s:.1f}"
 
     def __eq__(self, other: object) -> bool:
-        """Check for equality with other Sim(2) object."""
+        """Check for equality with other Sim(2) object.
+
+        The scale, rotation, and translation are compared element-wise as scalars, w/ the same tolerances and
+        handling of non-finite values as `np.isclose`/`np.allclose`.
+        """
         if not isinstance(other, Sim2):
             return False
 
-        if not np.isclose(self.scale, other.scale):
+        if not _isclose(self.scale, other.scale):
             return False
 
-        if not np.allclose(self.rotation, other.rotation):
+        if not all(_isclose(a, b) for a, b in zip(self.rotation.flat, other.rotation.flat)):
             return False
 
-        if not np.allclose(self.translation, other.translation):
+        if not all(_isclose(a, b) for a, b in zip(self.translation.flat, other.translation.flat)):
             return False
 
         return True
@@ -139,6 +162,45 @@ class Sim2:
         )
         # fmt: on
 
+    @staticmethod
+    def batch_compose(
+        Rs: NDArrayFloat, ts: NDArrayFloat, ss: NDArrayFloat
+    ) -> Tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+        """Compose each consecutive pair of N Sim(2) transforms, stored as separate arrays of parameters.
+
+        The i'th output is equivalent to `Sim2(Rs[i], ts[i], ss[i]).compose(Sim2(Rs[i+1], ts[i+1], ss[i+1]))`,
+        but all N-1 compositions are computed in a single vectorized pass, without constructing `Sim2` objects.
+
+        Args:
+            Rs: Nx2x2 array of 2d rotation matrices.
+            ts: Nx2 array of 2d translations.
+            ss: (N,) array of scaling factors.
+
+        Returns:
+            (N-1)x2x2 composed rotations, (N-1)x2 composed translations, and (N-1,) composed scales.
+
+        Raises:
+            ValueError: If `Rs`, `ts`, or `ss` have the wrong shape, or do not describe the same number of
+                Sim(2) transforms.
+        """
+        # `assert_np_array_shape` only checks the leading dimensions, so the number of dimensions is checked explicitly.
+        if not Rs.ndim == 3:
+            raise ValueError("Rotations must be a 3-dimensional array.")
+        if not ts.ndim == 2:
+            raise ValueError("Translations must be a 2-dimensional array.")
+        if not ss.ndim == 1:
+            raise ValueError("Scales must be a 1-dimensional array.")
+        assert_np_array_shape(Rs, (None, 2, 2))
+        assert_np_array_shape(ts, (None, 2))
+        assert_np_array_shape(ss, (None,))
+        if not len(Rs) == len(ts) == len(ss):
+            raise ValueError("Rotations, translations, and scales must have the same length.")
+
+        Rs_composed: NDArrayFloat = Rs[:-1] @ Rs[1:]
+        ts_composed: NDArrayFloat = np.einsum("nij,nj->ni", Rs[:-1], ts[1:]) + ts[:-1] / ss[1:, None]
+        ss_composed: NDArrayFloat = ss[:-1] * ss[1:]
+        return Rs_composed, ts_composed, ss_composed
+
     def inverse(self) -> Sim2:
         """Return the inverse."""
         Rt = self.R.T
@@ -162,9 +224,11 @@ class Sim2:
         Raises:
             ValueError: if `points_xy` isn't in R^2.
         """
+        # Check `ndim` and the number of columns directly, w/o reshaping or copying the input.
         if not points_xy.ndim == 2:
             raise ValueError("Input points are not 2-dimensional.")
-        assert_np_array_shape(points_xy, (None, 2))
+        if not points_xy.shape[1] == 2:
+            raise ValueError(f"array.shape[1]: {points_xy.shape[1]} != 2.")
         # (2,2) x (2,N) + (2,1) = (2,N) -> transpose
         transformed_point_cloud: NDArrayFloat = (points_xy @ self.R.T) + self.t
 
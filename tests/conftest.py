@@ -3,11 +3,28 @@
 """Constants used for unit tests."""
 
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
 
+import av2.utils.io as io_utils
+
 
 @pytest.fixture(scope="session")
 def test_data_root_dir() -> Path:
     """Return the absolute path to the root directory for test data."""
     return Path(__file__).resolve().parent / "test_data"
+
+
+@pytest.fixture(scope="session")
+def sim2_b_json_dict(test_data_root_dir: Path) -> Dict[str, Any]:
+    """Return the parsed contents of the `a_Sim2_b.json` test file, read once per session.
+
+    Args:
+        test_data_root_dir: Path to the root dir for test data (provided via fixture).
+
+    Returns:
+        Dictionary w/ flattened rotation "R", translation "t", and scale "s".
+    """
+    json_dict: Dict[str, Any] = io_utils.read_json_file(test_data_root_dir / "a_Sim2_b.json")
+    return json_dict
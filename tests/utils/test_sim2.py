@@ -3,9 +3,12 @@
 """Unit tests for Sim(2) related utilities."""
 
 import math
+import time
+from functools import lru_cache
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Dict, Final, List, Tuple
 
+import numba as nb
 import numpy as np
 import pytest
 
@@ -13,147 +16,308 @@ import av2.utils.io as io_utils
 from av2.geometry.sim2 import Sim2
 from av2.utils.typing import NDArrayFloat
 
+
+def _read_only_vector(x: float, y: float) -> NDArrayFloat:
+    """Return a read-only (2,) float array, so that it can be shared safely across tests."""
+    v = np.array([x, y], dtype=np.float64)
+    v.setflags(write=False)
+    return v
+
+
+_T12 = _read_only_vector(1.0, 2.0)
+_T21 = _read_only_vector(2.0, 1.0)
+_T13 = _read_only_vector(1.0, 3.0)
+_T34 = _read_only_vector(3.0, 4.0)
+_T_NEG26 = _read_only_vector(-2.0, -6.0)
+
 _TEST_DATA_ROOT = Path(__file__).resolve().parent.parent / "test_data"
 
+# Minimum speedup of `Sim2.batch_compose` over composing `Sim2` objects in a Python loop.
+_BATCH_COMPOSE_MIN_SPEEDUP: Final[float] = 50.0
 
-def test_constructor() -> None:
-    """Sim(2) to perform p_b = bSa * p_a."""
-    bRa = np.eye(2)
-    bta: NDArrayFloat = np.array([1.0, 2.0])
-    bsa = 3.0
-    bSa = Sim2(R=bRa, t=bta, s=bsa)
-    assert isinstance(bSa, Sim2)
-    assert np.allclose(bSa.R, bRa)
-    assert np.allclose(bSa.t, bta)
-    assert np.allclose(bSa.s, bsa)
 
+@pytest.fixture(scope="module")
+def imgSw() -> Sim2:
+    """Return a Sim(2) transform from world to image coordinates, with identity rotation.
 
-def test_is_eq() -> None:
-    """Ensure object equality works properly (are equal)."""
-    bSa = Sim2(R=np.eye(2), t=np.array([1, 2]), s=3.0)
-    bSa_ = Sim2(R=np.eye(2), t=np.array([1.0, 2.0]), s=3)
-    assert bSa == bSa_
+    Returns:
+        Sim(2) transform w/ translation (1,3) and scale 2.
+    """
+    return Sim2(R=np.eye(2), t=_T13, s=2.0)
+
+
+@pytest.fixture(scope="module")
+def wSimg() -> Sim2:
+    """Return a Sim(2) transform from image to world coordinates, i.e. the inverse of `imgSw`.
 
+    Returns:
+        Sim(2) transform w/ translation (-2,-6) and scale 0.5.
+    """
+    return Sim2(R=np.eye(2), t=_T_NEG26, s=0.5)
 
-def test_not_eq_translation() -> None:
-    """Ensure object equality works properly (not equal translation)."""
-    bSa = Sim2(R=np.eye(2), t=np.array([2, 1]), s=3.0)
-    bSa_ = Sim2(R=np.eye(2), t=np.array([1.0, 2.0]), s=3)
-    assert bSa != bSa_
 
+@pytest.fixture(scope="module")
+def identity_sim2() -> Sim2:
+    """Return the identity Sim(2) transform.
 
-def test_not_eq_rotation() -> None:
-    """Ensure object equality works properly (not equal rotation)."""
-    bSa = Sim2(R=np.eye(2), t=np.array([2, 1]), s=3.0)
-    bSa_ = Sim2(R=-1 * np.eye(2), t=np.array([2.0, 1.0]), s=3)
-    assert bSa != bSa_
+    Returns:
+        Sim(2) transform w/ identity rotation, zero translation, and unit scale.
+    """
+    return Sim2(R=np.eye(2), t=np.zeros((2,)), s=1.0)
 
 
-def test_not_eq_scale() -> None:
-    """Ensure object equality works properly (not equal scale)."""
-    bSa = Sim2(R=np.eye(2), t=np.array([2, 1]), s=3.0)
-    bSa_ = Sim2(R=np.eye(2), t=np.array([2.0, 1.0]), s=1.0)
-    assert bSa != bSa_
+@pytest.fixture(scope="module")
+def bSa_eq_base() -> Sim2:
+    """Return the Sim(2) transform that equality tests compare against.
 
+    Returns:
+        Sim(2) transform w/ identity rotation, translation (1,2) and scale 3.
+    """
+    return Sim2(R=np.eye(2), t=_T12, s=3.0)
 
-def test_rotation() -> None:
-    """Ensure rotation component is returned properly."""
-    R: NDArrayFloat = np.array([[0, -1], [1, 0]])
-    t: NDArrayFloat = np.array([1, 2])
-    bSa = Sim2(R=R, t=t, s=3.0)
 
-    expected_R: NDArrayFloat = np.array([[0, -1], [1, 0]])
-    assert np.allclose(expected_R, bSa.rotation)
+@pytest.fixture(scope="module")
+def bSa_rot90() -> Sim2:
+    """Return a Sim(2) transform w/ a 90 degree rotation.
 
+    Returns:
+        Sim(2) transform w/ 90 degree rotation, translation (1,2) and scale 3.
+    """
+    R = np.array([[0, -1], [1, 0]])
+    return Sim2(R=R, t=_T12, s=3.0)
 
-def test_translation() -> None:
-    """Ensure translation component is returned properly."""
-    R: NDArrayFloat = np.array([[0, -1], [1, 0]])
-    t: NDArrayFloat = np.array([1, 2])
-    bSa = Sim2(R=R, t=t, s=3.0)
 
-    expected_t: NDArrayFloat = np.array([1, 2])
-    assert np.allclose(expected_t, bSa.translation)
+def test_constructor() -> None:
+    """Sim(2) to perform p_b = bSa * p_a."""
+    bRa = np.eye(2)
+    bta = _T12
+    bsa = 3.0
+    bSa = Sim2(R=bRa, t=bta, s=bsa)
+    assert isinstance(bSa, Sim2)
+    assert np.array_equal(bSa.R, bRa)
+    assert np.array_equal(bSa.t, bta)
+    assert bSa.s == bsa
+
+
+@pytest.mark.parametrize(
+    "R, t, s, expected_eq",
+    [
+        (np.eye(2), _T12, 3, True),
+        (np.eye(2), _T21, 3, False),
+        (-1 * np.eye(2), _T12, 3, False),
+        (np.eye(2), _T12, 1.0, False),
+    ],
+    ids=["equal", "not equal translation", "not equal rotation", "not equal scale"],
+)
+def test_eq(bSa_eq_base: Sim2, R: NDArrayFloat, t: NDArrayFloat, s: float, expected_eq: bool) -> None:
+    """Ensure object equality works properly, when changing one attribute at a time.
+
+    Args:
+        bSa_eq_base: Sim(2) transform to compare against (provided via fixture).
+        R: 2x2 rotation matrix of the Sim(2) transform to compare.
+        t: translation of the Sim(2) transform to compare.
+        s: scale of the Sim(2) transform to compare.
+        expected_eq: whether the two Sim(2) transforms are expected to be equal.
+    """
+    bSa_ = Sim2(R=R, t=t, s=s)
+    assert (bSa_eq_base == bSa_) == expected_eq
+    assert (bSa_eq_base != bSa_) != expected_eq
+
+
+@pytest.mark.parametrize(
+    "t1, t2, expected_eq",
+    [
+        ([np.inf, 0.0], [np.inf, 0.0], True),
+        ([np.inf, 0.0], [-np.inf, 0.0], False),
+        ([1e308, 0.0], [np.inf, 0.0], False),
+        ([np.nan, 0.0], [np.nan, 0.0], False),
+    ],
+    ids=["equal infinities", "opposite infinities", "finite vs. infinite", "nan"],
+)
+def test_eq_non_finite(t1: List[float], t2: List[float], expected_eq: bool) -> None:
+    """Ensure equality treats non-finite translations the same way as `np.allclose`.
+
+    Args:
+        t1: translation of the first Sim(2) transform.
+        t2: translation of the second Sim(2) transform.
+        expected_eq: whether the two Sim(2) transforms are expected to be equal.
+    """
+    aSb = Sim2(R=np.eye(2), t=np.array(t1), s=1.0)
+    aSb_ = Sim2(R=np.eye(2), t=np.array(t2), s=1.0)
+    assert np.allclose(aSb.translation, aSb_.translation) == expected_eq
+    assert (aSb == aSb_) == expected_eq
+
+
+def test_benchmark_sim2_eq(benchmark: Callable[..., Any]) -> None:
+    """Benchmark equality checks over 10^4 pairs of Sim(2) transforms."""
+    num_pairs = 10**4
+    rng = np.random.default_rng(seed=0)
+    ts = rng.normal(size=(num_pairs, 2))
+    pairs = [(Sim2(R=np.eye(2), t=t, s=2.0), Sim2(R=np.eye(2), t=t.copy(), s=2.0)) for t in ts]
+
+    def benchmark_eq(pairs: List[Tuple[Sim2, Sim2]]) -> bool:
+        """Compare each pair of Sim(2) transforms."""
+        return all(aSb == aSb_ for aSb, aSb_ in pairs)
+
+    assert benchmark(benchmark_eq, pairs)
+
+
+def test_rotation(bSa_rot90: Sim2) -> None:
+    """Ensure rotation component is returned properly.
+
+    Args:
+        bSa_rot90: Sim(2) transform w/ 90 degree rotation (provided via fixture).
+    """
+    expected_R = np.array([[0, -1], [1, 0]])
+    assert np.array_equal(expected_R, bSa_rot90.rotation)
+
+
+def test_translation(bSa_rot90: Sim2) -> None:
+    """Ensure translation component is returned properly.
+
+    Args:
+        bSa_rot90: Sim(2) transform w/ 90 degree rotation (provided via fixture).
+    """
+    expected_t = np.array([1, 2], dtype=np.float64)
+    assert np.array_equal(expected_t, bSa_rot90.translation)
 
 
 def test_scale() -> None:
     """Ensure the scale factor is returned properly."""
     bRa = np.eye(2)
-    bta: NDArrayFloat = np.array([1, 2])
+    bta = _T12
     bsa = 3.0
     bSa = Sim2(R=bRa, t=bta, s=bsa)
-    assert bSa.scale == 3.0
-
+    assert bSa.scale == pytest.approx(3.0)
 
-def test_compose_1() -> None:
-    """Ensure we can compose two Sim(2) transforms together, with identity rotations."""
-    scale = 2.0
-    imgSw = Sim2(R=np.eye(2), t=np.array([1.0, 3.0]), s=scale)
 
-    scale = 0.5
-    wSimg = Sim2(R=np.eye(2), t=np.array([-2.0, -6.0]), s=scale)
+def test_compose_1(imgSw: Sim2, wSimg: Sim2, identity_sim2: Sim2) -> None:
+    """Ensure we can compose two Sim(2) transforms together, with identity rotations.
 
-    # identity
-    wSw = Sim2(R=np.eye(2), t=np.zeros((2,)), s=1.0)
-    assert wSw == imgSw.compose(wSimg)
+    Args:
+        imgSw: Sim(2) transform from world to image coordinates (provided via fixture).
+        wSimg: Sim(2) transform from image to world coordinates (provided via fixture).
+        identity_sim2: Identity Sim(2) transform (provided via fixture).
+    """
+    assert identity_sim2 == imgSw.compose(wSimg)
 
 
 def test_compose_2() -> None:
     """Verify composition of Sim2 objects works for non-identity input."""
-    aSb = Sim2(R=rotmat2d(np.deg2rad(90)), t=np.array([1, 2]), s=4)
+    aSb = Sim2(R=rotmat2d(np.deg2rad(90)), t=_T12, s=4)
 
-    bSc = Sim2(R=rotmat2d(np.deg2rad(-45)), t=np.array([3, 4]), s=0.5)
+    bSc = Sim2(R=rotmat2d(np.deg2rad(-45)), t=_T34, s=0.5)
 
     aSc = aSb.compose(bSc)
     # Via composition: 90 + -45 = 45 degrees
-    assert math.isclose(aSc.theta_deg, 45.0)
+    assert aSc.theta_deg == pytest.approx(45.0, abs=1e-12)
     # Via composition: 4 * 0.5 = 2.0
-    assert aSc.scale == 2.0
+    assert aSc.scale == pytest.approx(2.0)
 
 
-def test_compose_3() -> None:
-    """Verify correctness of composed inverted and non-inverted transformations."""
+def test_compose_3(identity_sim2: Sim2) -> None:
+    """Verify correctness of composed inverted and non-inverted transformations.
+
+    Args:
+        identity_sim2: Identity Sim(2) transform (provided via fixture).
+    """
     # Note: these are dummy translation values; should be ignored when considering correctness
-    aSb = Sim2(R=rotmat2d(np.deg2rad(20)), t=np.array([1, 2]), s=2)
+    aSb = Sim2(R=rotmat2d(np.deg2rad(20)), t=_T12, s=2)
 
-    bSc = Sim2(R=rotmat2d(np.deg2rad(30)), t=np.array([1, 2]), s=3)
+    bSc = Sim2(R=rotmat2d(np.deg2rad(30)), t=_T12, s=3)
 
-    aSc = Sim2(R=rotmat2d(np.deg2rad(50)), t=np.array([1, 2]), s=6)
+    aSc = Sim2(R=rotmat2d(np.deg2rad(50)), t=_T12, s=6)
 
     # ground truth is an identity transformation
-    aSa_gt = Sim2(R=np.eye(2), t=np.zeros(2), s=1.0)
     aSa_est = aSb.compose(bSc).compose(aSc.inverse())
 
-    assert np.isclose(aSa_gt.theta_deg, aSa_est.theta_deg, atol=1e-5)
+    assert aSa_est.theta_deg == pytest.approx(identity_sim2.theta_deg, abs=1e-5)
+
 
+def test_batch_compose_vectorized() -> None:
+    """Ensure batched composition matches, and is much faster than, composing Sim(2) objects one pair at a time."""
+    num_transforms = 10**4
+    rng = np.random.default_rng(seed=0)
+    angles = rng.uniform(-np.pi, np.pi, size=num_transforms)
+    Rs = rotmat2d_batch(angles)
+    ts = rng.normal(size=(num_transforms, 2))
+    ss = np.abs(rng.normal(size=num_transforms)) + 0.1
+    sim2_list = [Sim2(R=R, t=t, s=float(s)) for R, t, s in zip(Rs, ts, ss)]
 
-def test_inverse() -> None:
-    """Ensure that the .inverse() method returns the correct result."""
-    scale = 2.0
-    imgSw = Sim2(R=np.eye(2), t=np.array([1.0, 3.0]), s=scale)
+    start = time.perf_counter()
+    expected = [aSb.compose(bSc) for aSb, bSc in zip(sim2_list[:-1], sim2_list[1:])]
+    loop_duration_s = time.perf_counter() - start
 
-    scale = 0.5
-    wSimg = Sim2(R=np.eye(2), t=np.array([-2.0, -6.0]), s=scale)
+    # Use the fastest of several runs, so that a single scheduler hiccup cannot fail the speedup check.
+    batch_duration_s = math.inf
+    for _ in range(5):
+        start = time.perf_counter()
+        Rs_composed, ts_composed, ss_composed = Sim2.batch_compose(Rs, ts, ss)
+        batch_duration_s = min(batch_duration_s, time.perf_counter() - start)
 
+    assert np.allclose(Rs_composed, np.stack([aSc.rotation for aSc in expected]))
+    assert np.allclose(ts_composed, np.stack([aSc.translation for aSc in expected]))
+    assert np.allclose(ss_composed, [aSc.scale for aSc in expected])
+    assert loop_duration_s >= _BATCH_COMPOSE_MIN_SPEEDUP * batch_duration_s
+
+
+def test_batch_compose_mismatched_lengths() -> None:
+    """Ensure that batched composition rejects parameter arrays of different lengths."""
+    with pytest.raises(ValueError):
+        Sim2.batch_compose(np.stack([np.eye(2)] * 3), np.zeros((2, 2)), np.ones(3))
+
+
+@pytest.mark.parametrize(
+    "Rs_shape, ts_shape, ss_shape",
+    [
+        ((3, 2, 2), (3, 2), (3, 1)),
+        ((3, 2), (3, 2), (3,)),
+        ((3, 2, 2, 1), (3, 2), (3,)),
+        ((3, 2, 2), (3, 2, 1), (3,)),
+    ],
+    ids=["(N,1) scales", "(N,2) rotations", "(N,2,2,1) rotations", "(N,2,1) translations"],
+)
+def test_batch_compose_wrong_dims(
+    Rs_shape: Tuple[int, ...], ts_shape: Tuple[int, ...], ss_shape: Tuple[int, ...]
+) -> None:
+    """Ensure that batched composition rejects parameter arrays w/ the wrong number of dimensions.
+
+    Args:
+        Rs_shape: shape of the rotations array.
+        ts_shape: shape of the translations array.
+        ss_shape: shape of the scales array.
+    """
+    with pytest.raises(ValueError):
+        Sim2.batch_compose(np.ones(Rs_shape), np.zeros(ts_shape), np.ones(ss_shape))
+
+
+def test_inverse(imgSw: Sim2, wSimg: Sim2) -> None:
+    """Ensure that the .inverse() method returns the correct result.
+
+    Args:
+        imgSw: Sim(2) transform from world to image coordinates (provided via fixture).
+        wSimg: Sim(2) transform from image to world coordinates (provided via fixture).
+    """
     assert imgSw == wSimg.inverse()
     assert wSimg == imgSw.inverse()
 
 
-def test_matrix() -> None:
-    """Ensure 3x3 matrix is formed correctly."""
-    bRa: NDArrayFloat = np.array([[0, -1], [1, 0]])
-    bta: NDArrayFloat = np.array([1, 2])
-    bsa = 3.0
-    bSa = Sim2(R=bRa, t=bta, s=bsa)
+def test_matrix(bSa_rot90: Sim2) -> None:
+    """Ensure 3x3 matrix is formed correctly.
 
-    bSa_expected: NDArrayFloat = np.array([[0, -1, 1], [1, 0, 2], [0, 0, 1 / 3]])
-    assert np.allclose(bSa_expected, bSa.matrix)
+    Args:
+        bSa_rot90: Sim(2) transform w/ 90 degree rotation (provided via fixture).
+    """
+    bSa_expected = np.array([[0, -1, 1], [1, 0, 2], [0, 0, 1 / 3]])
+    # the top two rows are exactly representable, whereas the bottom row holds 1 / scale
+    assert np.array_equal(bSa_expected[:2], bSa_rot90.matrix[:2])
+    assert np.allclose(bSa_expected[2], bSa_rot90.matrix[2])
 
 
 def test_from_matrix() -> None:
     """Ensure that classmethod can construct an object instance from a 3x3 numpy matrix."""
-    bRa: NDArrayFloat = np.array([[0, -1], [1, 0]])
-    bta: NDArrayFloat = np.array([1, 2])
+    bRa = np.array([[0, -1], [1, 0]])
+    bta = _T12
     bsa = 3.0
     bSa = Sim2(R=bRa, t=bta, s=bsa)
 
@@ -168,20 +332,24 @@ def test_from_matrix() -> None:
     assert np.isclose(bSa_.scale, bsa)
 
     # ensure generated class object has correct 3x3 matrix attribute
-    bSa_expected: NDArrayFloat = np.array([[0, -1, 1], [1, 0, 2], [0, 0, 1 / 3]])
+    bSa_expected = np.array([[0, -1, 1], [1, 0, 2], [0, 0, 1 / 3]])
     assert np.allclose(bSa_expected, bSa_.matrix)
 
 
-def test_matrix_homogenous_transform() -> None:
-    """Ensure 3x3 matrix transforms homogenous points as expected."""
-    expected_img_pts: NDArrayFloat = np.array([[6, 4], [4, 6], [0, 0], [1, 7]])
+def test_matrix_homogenous_transform(imgSw: Sim2) -> None:
+    """Ensure 3x3 matrix transforms homogenous points as expected.
+
+    Args:
+        imgSw: Sim(2) transform from world to image coordinates (provided via fixture).
+    """
+    expected_img_pts = np.array([[6, 4], [4, 6], [0, 0], [1, 7]])
 
-    world_pts: NDArrayFloat = np.array([[2, -1], [1, 0], [-1, -3], [-0.5, 0.5]])
-    scale = 2.0
-    imgSw = Sim2(R=np.eye(2), t=np.array([1.0, 3.0]), s=scale)
+    world_pts = np.array([[2, -1], [1, 0], [-1, -3], [-0.5, 0.5]])
 
-    # convert to homogeneous
-    world_pts_h: NDArrayFloat = np.hstack([world_pts, np.ones((4, 1))])
+    # convert to homogeneous, filling a preallocated array instead of concatenating.
+    world_pts_h = np.empty((4, 3))
+    world_pts_h[:, :2] = world_pts
+    world_pts_h[:, 2] = 1.0
 
     # multiply each (3,1) homogeneous point vector w/ transform matrix
     img_pts_h = (imgSw.matrix @ world_pts_h.T).T
@@ -189,43 +357,121 @@ def test_matrix_homogenous_transform() -> None:
     img_pts = img_pts_h[:, :2] / img_pts_h[:, 2].reshape(-1, 1)
     assert np.allclose(expected_img_pts, img_pts)
 
+    # the (2,2) rotation block, translation, and scale give the same result without homogeneous coordinates
+    img_pts_ = imgSw.scale * (world_pts @ imgSw.rotation.T + imgSw.translation)
+    assert np.allclose(expected_img_pts, img_pts_)
+
+
+def test_transform_from_forwards(imgSw: Sim2) -> None:
+    """Test Similarity(2) forward transform.
 
-def test_transform_from_forwards() -> None:
-    """Test Similarity(2) forward transform."""
-    expected_img_pts: NDArrayFloat = np.array([[6, 4], [4, 6], [0, 0], [1, 7]])
+    Args:
+        imgSw: Sim(2) transform from world to image coordinates (provided via fixture).
+    """
+    expected_img_pts = np.array([[6, 4], [4, 6], [0, 0], [1, 7]])
 
-    world_pts: NDArrayFloat = np.array([[2, -1], [1, 0], [-1, -3], [-0.5, 0.5]])
-    scale = 2.0
-    imgSw = Sim2(R=np.eye(2), t=np.array([1.0, 3.0]), s=scale)
+    world_pts = np.array([[2, -1], [1, 0], [-1, -3], [-0.5, 0.5]])
 
     img_pts = imgSw.transform_from(world_pts)
     assert np.allclose(expected_img_pts, img_pts)
 
 
-def test_transform_from_backwards() -> None:
-    """Test Similarity(2) backward transform."""
-    img_pts: NDArrayFloat = np.array([[6, 4], [4, 6], [0, 0], [1, 7]])
+@pytest.mark.parametrize("num_points", [4, 1000, 10**6], ids=["4 points", "1k points", "1M points"])
+def test_transform_from_round_trip_bulk(imgSw: Sim2, wSimg: Sim2, num_points: int) -> None:
+    """Ensure forward then backward Similarity(2) transforms recover large point clouds, in a vectorized fashion.
 
-    expected_world_pts: NDArrayFloat = np.array([[2, -1], [1, 0], [-1, -3], [-0.5, 0.5]])
-    scale = 0.5
-    wSimg = Sim2(R=np.eye(2), t=np.array([-2.0, -6.0]), s=scale)
+    Args:
+        imgSw: Sim(2) transform from world to image coordinates (provided via fixture).
+        wSimg: Sim(2) transform from image to world coordinates (provided via fixture).
+        num_points: number of 2d points to transform.
+    """
+    rng = np.random.default_rng(seed=0)
+    world_pts = rng.standard_normal((num_points, 2))
+
+    img_pts = imgSw.transform_from(world_pts)
+    world_pts_ = wSimg.transform_from(img_pts)
+
+    assert img_pts.shape == (num_points, 2)
+    assert world_pts_.shape == (num_points, 2)
+    assert np.allclose(world_pts_, world_pts, atol=1e-9)
+
+
+def test_benchmark_sim2_transform_from_1M(benchmark: Callable[..., Any], imgSw: Sim2) -> None:
+    """Benchmark Sim(2) transformation of 1M points.
+
+    Args:
+        benchmark: Benchmark fixture (provided via `pytest-benchmark`).
+        imgSw: Sim(2) transform from world to image coordinates (provided via fixture).
+    """
+    rng = np.random.default_rng(seed=0)
+    world_pts = rng.standard_normal((10**6, 2))
+    benchmark(imgSw.transform_from, world_pts)
+
+
+def test_transform_from_backwards(wSimg: Sim2) -> None:
+    """Test Similarity(2) backward transform.
+
+    Args:
+        wSimg: Sim(2) transform from image to world coordinates (provided via fixture).
+    """
+    img_pts = np.array([[6, 4], [4, 6], [0, 0], [1, 7]])
+
+    expected_world_pts = np.array([[2, -1], [1, 0], [-1, -3], [-0.5, 0.5]])
 
     world_pts = wSimg.transform_from(img_pts)
     assert np.allclose(expected_world_pts, world_pts)
 
 
+@nb.njit(cache=True)
+def _rotmat2d_kernel(theta: float) -> NDArrayFloat:
+    """Fill a 2x2 rotation matrix for angle `theta` (in radians), entry by entry."""
+    R = np.empty((2, 2))
+    c = math.cos(theta)
+    s = math.sin(theta)
+    R[0, 0] = c
+    R[0, 1] = -s
+    R[1, 0] = s
+    R[1, 1] = c
+    return R
+
+
+@lru_cache(maxsize=32)
 def rotmat2d(theta: float) -> NDArrayFloat:
-    """Convert angle `theta` (in radians) to a 2x2 rotation matrix."""
-    s = np.sin(theta)
-    c = np.cos(theta)
-    R: NDArrayFloat = np.array([[c, -s], [s, c]])
+    """Convert a scalar angle `theta` (in radians) to a 2x2 rotation matrix.
+
+    Results are cached per angle, so the returned array is marked read-only. For arrays of angles,
+    use `rotmat2d_batch()` instead.
+    """
+    R = _rotmat2d_kernel(theta)
+    R.setflags(write=False)
     return R
 
 
+def rotmat2d_batch(thetas: NDArrayFloat) -> NDArrayFloat:
+    """Convert (N,) angles `thetas` (in radians) to (N,2,2) rotation matrices, in a vectorized fashion."""
+    c = np.cos(thetas)
+    s = np.sin(thetas)
+    Rs: NDArrayFloat = np.stack([np.stack([c, -s], axis=-1), np.stack([s, c], axis=-1)], axis=-2)
+    return Rs
+
+
+def _theta_deg_fast(R: NDArrayFloat) -> float:
+    """Recover the rotation angle (in degrees) of a 2x2 rotation matrix directly from its first column."""
+    return math.degrees(math.atan2(R[1, 0], R[0, 0]))
+
+
+def test_rotmat2d_batch() -> None:
+    """Ensure vectorized rotation matrix construction agrees w/ the scalar `rotmat2d`."""
+    thetas = np.deg2rad([90.0, -45.0, 20.0, 30.0, 50.0, 135.0])
+    Rs = rotmat2d_batch(thetas)
+    assert Rs.shape == (6, 2, 2)
+    assert np.allclose(Rs, np.stack([rotmat2d(theta) for theta in thetas]))
+
+
 def test_cannot_set_zero_scale() -> None:
     """Ensure that an exception is thrown if Sim(2) scale is set to zero."""
-    R: NDArrayFloat = np.eye(2, dtype=float)
-    t: NDArrayFloat = np.arange(2, dtype=float)
+    R = np.eye(2, dtype=float)
+    t = np.arange(2, dtype=float)
     s = 0.0
 
     with pytest.raises(ZeroDivisionError) as e_info:
@@ -234,26 +480,39 @@ def test_cannot_set_zero_scale() -> None:
 
 def test_sim2_theta_deg_1() -> None:
     """Ensure we can recover the rotation angle theta, when theta=0 degrees."""
-    R: NDArrayFloat = np.eye(2, dtype=float)
-    t: NDArrayFloat = np.arange(2, dtype=float)
+    R = np.eye(2, dtype=float)
+    t = np.arange(2, dtype=float)
     s = 10.5
     aSb = Sim2(R, t, s)
-    assert aSb.theta_deg == 0
+    assert aSb.theta_deg == pytest.approx(0.0, abs=1e-12)
 
 
 def test_sim2_theta_deg_2() -> None:
     """Ensure we can recover the rotation angle theta, when theta=135 degrees."""
-    R: NDArrayFloat = rotmat2d(np.deg2rad(135))
-    t: NDArrayFloat = np.arange(2, dtype=float)
+    R = rotmat2d(np.deg2rad(135))
+    t = np.arange(2, dtype=float)
     s = 10.5
     aSb = Sim2(R, t, s)
-    assert aSb.theta_deg == 135
+    assert aSb.theta_deg == pytest.approx(135.0, abs=1e-10)
+
+
+@pytest.mark.parametrize("theta_deg", [0.0, 135.0], ids=["0 degrees", "135 degrees"])
+def test_sim2_theta_deg_matches_direct_element_access(theta_deg: float) -> None:
+    """Ensure `theta_deg` agrees exactly w/ atan2 evaluated on the rotation matrix entries.
+
+    Args:
+        theta_deg: Rotation angle (in degrees) used to build the Sim(2) transform.
+    """
+    R = rotmat2d(np.deg2rad(theta_deg))
+    t = np.arange(2, dtype=float)
+    aSb = Sim2(R, t, 10.5)
+    assert aSb.theta_deg == _theta_deg_fast(R)
 
 
 def test_sim2_repr() -> None:
     """Ensure we can print the class, and obtain the correct string representation from __repr__."""
-    R: NDArrayFloat = np.eye(2, dtype=float)
-    t: NDArrayFloat = np.arange(2, dtype=float)
+    R = np.eye(2, dtype=float)
+    t = np.arange(2, dtype=float)
     s = 10.5
     aSb = Sim2(R, t, s)
     print(aSb)
@@ -263,21 +522,45 @@ def test_sim2_repr() -> None:
 def test_transform_from_wrong_dims() -> None:
     """Ensure that 1d input is not allowed (row vectors are required, as Nx2)."""
     bRa = np.eye(2)
-    bta: NDArrayFloat = np.array([1, 2])
+    bta = _T12
     bsa = 3.0
     bSa = Sim2(R=bRa, t=bta, s=bsa)
 
     with pytest.raises(ValueError):
-        bSa.transform_from(np.array([1.0, 3.0]))
+        bSa.transform_from(_T13)
+
+
+def test_transform_from_wrong_num_columns() -> None:
+    """Ensure that Nx3 input is not allowed (2d points are required, as Nx2)."""
+    bSa = Sim2(R=np.eye(2), t=_T12, s=3.0)
+
+    with pytest.raises(ValueError):
+        bSa.transform_from(np.zeros((4, 3)))
+
+
+def test_benchmark_sim2_transform_from_single_point(benchmark: Callable[..., Any]) -> None:
+    """Benchmark Sim(2) transformation of a single (1,2) point."""
+    bSa = Sim2(R=np.eye(2), t=_T12, s=3.0)
+    point_xy = np.array([[1.0, 3.0]])
+    benchmark(bSa.transform_from, point_xy)
 
 
-def test_from_json() -> None:
-    """Ensure that classmethod can construct an object instance from a json file."""
+def test_from_json(sim2_b_json_dict: Dict[str, Any]) -> None:
+    """Ensure that classmethod can construct an object instance from a json file.
+
+    Args:
+        sim2_b_json_dict: Parsed contents of the JSON file (provided via fixture).
+    """
     json_fpath = _TEST_DATA_ROOT / "a_Sim2_b.json"
     aSb = Sim2.from_json(json_fpath)
 
-    expected_rotation: NDArrayFloat = np.array([[1.0, 0.0], [0.0, 1.0]])
-    expected_translation: NDArrayFloat = np.array([3930.0, 3240.0])
+    # ensure the instance reflects the serialized (row-major) parameters
+    assert np.array_equal(aSb.rotation.flatten(), sim2_b_json_dict["R"])
+    assert np.array_equal(aSb.translation, sim2_b_json_dict["t"])
+    assert aSb.scale == sim2_b_json_dict["s"]
+
+    expected_rotation = np.array([[1.0, 0.0], [0.0, 1.0]])
+    expected_translation = np.array([3930.0, 3240.0])
     expected_scale = 1.6666666666666667
     assert np.allclose(aSb.rotation, expected_rotation)
     assert np.allclose(aSb.translation, expected_translation)
@@ -292,10 +575,14 @@ def test_from_json_invalid_scale() -> None:
         Sim2.from_json(json_fpath)
 
 
-def test_save_as_json() -> None:
-    """Ensure that JSON serialization of a class instance works correctly."""
-    bSc = Sim2(R=np.array([[0, 1], [1, 0]]), t=np.array([-5, 5]), s=0.1)
-    save_fpath = Path(NamedTemporaryFile().name)
+def test_save_as_json(tmp_path: Path) -> None:
+    """Ensure that JSON serialization of a class instance works correctly.
+
+    Args:
+        tmp_path: Temp directory used in the test (provided via built-in fixture).
+    """
+    bSc = Sim2(R=np.array([[0, 1], [1, 0]]), t=np.array([-5, 5], dtype=np.float64), s=0.1)
+    save_fpath = tmp_path / "bSc.json"
     bSc.save_as_json(save_fpath=save_fpath)
 
     bSc_dict = io_utils.read_json_file(save_fpath)
@@ -304,10 +591,14 @@ def test_save_as_json() -> None:
     assert bSc_dict["s"] == 0.1
 
 
-def test_round_trip() -> None:
-    """Test round trip of serialization, then de-serialization."""
-    bSc = Sim2(R=np.array([[0, 1], [1, 0]]), t=np.array([-5, 5]), s=0.1)
-    save_fpath = Path(NamedTemporaryFile().name)
+def test_round_trip(tmp_path: Path) -> None:
+    """Test round trip of serialization, then de-serialization.
+
+    Args:
+        tmp_path: Temp directory used in the test (provided via built-in fixture).
+    """
+    bSc = Sim2(R=np.array([[0, 1], [1, 0]]), t=np.array([-5, 5], dtype=np.float64), s=0.1)
+    save_fpath = tmp_path / "bSc.json"
     bSc.save_as_json(save_fpath=save_fpath)
 
     bSc_ = Sim2.from_json(save_fpath)